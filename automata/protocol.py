@@ -15,13 +15,128 @@
 # DEALINGS IN THE SOFTWARE.
 
 
+import os
 import json
 import typing
 import hashlib
+import msgpack
 import pydantic
+import xxhash
 import numpy as np
 import bittensor as bt
 
+try:
+    # orjson parses the legacy JSON metadata straight from bytes, several times faster than json.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Integrity hashes understood by the protocol, keyed by the name carried in the metadata.
+# The arrays travel inside the same signed synapse as their metadata, so the hash only has
+# to catch accidental corruption; sha256 remains available where a cryptographic digest is needed.
+HASH_ALGORITHMS = {
+    "xxh3_128": xxhash.xxh3_128,
+    "sha256": hashlib.sha256,
+}
+DEFAULT_HASH_ALG = "xxh3_128"
+# Metadata without a "hash_alg" entry was produced by peers that only knew sha256.
+_LEGACY_HASH_ALG = "sha256"
+# Synapses are signed by the dendrite, so re-hashing received arrays is opt-in on the hot path.
+# Set CA_VERIFY_HASH=1 (e.g. in CI) to check every received array against its metadata hash.
+VERIFY_HASH = os.environ.get("CA_VERIFY_HASH", "0").lower() in ("1", "true", "yes")
+
+
+def _as_buffer(array: np.ndarray) -> np.ndarray:
+    """
+    Return a flat byte view over the array's data, copying only if the array is not C-contiguous.
+    Works for empty and 0-d arrays, which memoryview.cast rejects.
+    """
+    return np.ascontiguousarray(array).reshape(-1).view(np.uint8)
+
+
+def _as_state(array: np.ndarray) -> np.ndarray:
+    """
+    Return the array as uint8 cell states, which is all the rules need and 8x smaller on the wire
+    than numpy's default int64. Raises ValueError if a value does not fit in a uint8.
+    """
+    if array.dtype == np.uint8:
+        return array
+    if array.size and (array.min() < 0 or array.max() > np.iinfo(np.uint8).max):
+        raise ValueError("cell states must fit in uint8")
+    return array.astype(np.uint8)
+
+
+def _pack_cells(array: np.ndarray) -> typing.Tuple[np.ndarray, bool]:
+    """
+    Return the wire buffer for a uint8 state array and whether it was bit-packed. Two-state
+    automata are packed eight cells per byte along the last axis; anything else, including
+    empty and 0-d arrays, is sent as is.
+    """
+    if array.ndim and array.size and array.max() <= 1:
+        return _as_buffer(np.packbits(array, axis=-1)), True
+    return _as_buffer(array), False
+
+
+def _unpack_cells(buffer: bytes, metadata: dict) -> np.ndarray:
+    """
+    Rebuild the state array described by the metadata from its wire buffer. Raw arrays are
+    returned as a zero-copy view; bit-packed ones are unpacked and the pad bits trimmed.
+    """
+    shape = tuple(metadata["shape"])
+    if not metadata.get("packed", False):
+        return np.frombuffer(buffer, dtype=np.dtype(metadata["dtype"])).reshape(shape)
+    packed = np.frombuffer(buffer, dtype=np.uint8)
+    packed = packed.reshape(shape[:-1] + ((shape[-1] + 7) // 8,))
+    return np.unpackbits(packed, axis=-1, count=shape[-1])
+
+
+def _hash(buffer: bytes, hash_alg: str) -> bytes:
+    """
+    Return the binary digest of a buffer with the named integrity hash.
+    """
+    if hash_alg not in HASH_ALGORITHMS:
+        raise ValueError(f"Unsupported hash algorithm: {hash_alg}")
+    return HASH_ALGORITHMS[hash_alg](buffer).digest()
+
+
+def _verify_hash(buffer: bytes, metadata: dict) -> bool:
+    """
+    Check a buffer against the digest carried in the metadata, comparing binary digests.
+    """
+    hash_alg = metadata.get("hash_alg", _LEGACY_HASH_ALG)
+    try:
+        expected = metadata.get("hash", b"")
+        if isinstance(expected, str):
+            # JSON metadata carries the digest hex encoded.
+            expected = bytes.fromhex(expected)
+        return _hash(buffer, hash_alg) == expected
+    except ValueError:
+        return False
+
+
+def _pack_metadata(metadata: dict) -> bytes:
+    """
+    Encode a metadata dictionary as a compact msgpack frame.
+    """
+    return msgpack.packb(metadata, use_bin_type=True)
+
+
+def _unpack_metadata(metadata_bytes: bytes) -> dict:
+    """
+    Decode a metadata frame. Peers on the previous release still send JSON metadata, which is
+    told apart by its opening brace (a msgpack map never starts with one).
+    """
+    if metadata_bytes[:1] == b"{":
+        return _json_loads(metadata_bytes)
+    return msgpack.unpackb(metadata_bytes, raw=False)
+
+
+def _head(buffer: typing.Optional[bytes], size: int = 12) -> bytes:
+    """
+    Return the first bytes of a field for logging, or b"" if the field is unset.
+    """
+    return bytes(memoryview(buffer)[:size]) if buffer else b""
+
 
 class IsAlive(bt.Synapse):
     answer: typing.Optional[str] = None
@@ -41,9 +156,9 @@ class CAsynapse(bt.Synapse):
 
     Attributes:
     - array_bytes (bytes): The serialized initial state of the cellular automata sent to the miner.
-    - metadata_bytes (bytes): The serialized metadata of the cellular automata parameters sent to the miner.
+    - metadata_bytes (bytes): The msgpack-serialized metadata of the cellular automata parameters sent to the miner.
     - automaton_bytes (bytes): The serialized evolved automaton to return to the validator.
-    - automaton_metadata_bytes (bytes): The serialized metadata of the evolved automaton to return to the validator.
+    - automaton_metadata_bytes (bytes): The msgpack-serialized metadata of the evolved automaton to return to the validator.
 
     Methods:
     - serialize_parameters: Serialize the initial state and starting parameters for transmission.
@@ -63,15 +178,18 @@ class CAsynapse(bt.Synapse):
         steps: int,
         rule_func: str,
         neighborhood_func: str,
+        hash_alg: str = DEFAULT_HASH_ALG,
     ) -> typing.Tuple[bytes, bytes]:
         """
         Serialize the cellular automata configuration and return the bytes for metadata and array.
+        The serialized bytes are also stored on the synapse for transmission.
 
         Args:
             - initial_state (np.ndarray): The initial state of the automata as a numpy array.
             - steps (int): The number of steps to simulate.
             - rule_func (str): The rule function as a string.
             - neighborhood_func (str): The neighborhood function as a string.
+            - hash_alg (str): The integrity hash to use, one of HASH_ALGORITHMS.
 
         Returns:
             typing.Tuple[bytes, bytes]: A tuple containing the serialized metadata, array and hash.
@@ -88,23 +206,35 @@ class CAsynapse(bt.Synapse):
         if not isinstance(neighborhood_func, str) or not neighborhood_func:
             raise ValueError("neighborhood_func must be a non-empty string")
 
-        array_bytes = initial_state.tobytes()
-        array_hash = hashlib.sha256(array_bytes).hexdigest()
+        initial_state = _as_state(initial_state)
+        # Hash straight from the wire buffer; the bytes field below is the only copy.
+        array_buffer, packed = _pack_cells(initial_state)
+        array_hash = _hash(array_buffer, hash_alg)
 
         metadata = {
             "dtype": str(initial_state.dtype),
             "shape": initial_state.shape,
+            "packed": packed,
             "hash": array_hash,
+            "hash_alg": hash_alg,
             "steps": steps,
             "rule_func": rule_func,
             "neighborhood_func": neighborhood_func,
         }
 
-        metadata_bytes = json.dumps(metadata).encode("utf-8")
+        metadata_bytes = _pack_metadata(metadata)
+        array_bytes = bytes(array_buffer)
+
+        # Carry the raw array buffer in its own field alongside the metadata.
+        self.metadata_bytes = metadata_bytes
+        self.array_bytes = array_bytes
         return metadata_bytes, array_bytes
 
     def deserialize_parameters(
-        metadata_bytes: bytes, array_bytes: bytes
+        self,
+        metadata_bytes: typing.Optional[bytes] = None,
+        array_bytes: typing.Optional[bytes] = None,
+        verify: typing.Optional[bool] = None,
     ) -> typing.Tuple[
         np.ndarray,
         typing.Optional[int],
@@ -115,8 +245,12 @@ class CAsynapse(bt.Synapse):
         Deserialize the parameters and return the cellular automata configuration for running the simulation.
 
         Args:
-            - metadata_bytes (bytes): The serialized metadata of the cellular automata parameters.
-            - array_bytes (bytes): The serialized initial state of the cellular automata.
+            - metadata_bytes (bytes, optional): The serialized metadata of the cellular automata parameters.
+              Defaults to the metadata_bytes carried by the synapse.
+            - array_bytes (bytes, optional): The serialized initial state of the cellular automata.
+              Defaults to the array_bytes carried by the synapse.
+            - verify (bool, optional): Whether to check the array against the metadata hash.
+              Defaults to VERIFY_HASH.
 
         Returns:
             A tuple containing the configuration parameters for the cellular automata simulation:
@@ -127,20 +261,24 @@ class CAsynapse(bt.Synapse):
             - neighborhood_func (str): The neighborhood function as a string.
 
         Raises:
-            ValueError: Data integrity error if the array hash does not match the hash in the metadata.
+            ValueError: Data integrity error if verifying and the array hash does not match the hash in the metadata.
         """
+        if metadata_bytes is None:
+            metadata_bytes = self.metadata_bytes
+        if array_bytes is None:
+            array_bytes = self.array_bytes
 
-        # Deserialize the metadata from bytes to a JSON string and then to a dictionary
-        metadata = json.loads(metadata_bytes.decode("utf-8"))
+        # Deserialize the metadata from bytes to a dictionary
+        metadata = _unpack_metadata(metadata_bytes)
 
         # Verify the integrity of the array bytes using the hash
-        array_hash = hashlib.sha256(array_bytes).hexdigest()
-        if array_hash != metadata.get("hash", ""):
+        if verify is None:
+            verify = VERIFY_HASH
+        if verify and not _verify_hash(array_bytes, metadata):
             raise ValueError("Data integrity check failed!")
 
-        # Reconstruct the numpy array using the metadata and the array bytes
-        initial_state = np.frombuffer(array_bytes, dtype=np.dtype(metadata["dtype"]))
-        initial_state = initial_state.reshape(metadata["shape"])
+        # Reconstruct the numpy array, unpacking two-state grids sent eight cells per byte
+        initial_state = _unpack_cells(array_bytes, metadata)
 
         # Access other metadata if available
         steps = metadata.get("steps")
@@ -150,12 +288,16 @@ class CAsynapse(bt.Synapse):
         # Return the initial state along with any other optional parameters that were provided
         return initial_state, steps, rule_func, neighborhood_func
 
-    def serialize_automaton(self, automaton: np.ndarray) -> bytes:
+    def serialize_automaton(
+        self, automaton: np.ndarray, hash_alg: str = DEFAULT_HASH_ALG
+    ) -> bytes:
         """
         Serialize the automaton and return the bytes for the automaton and metadata.
+        The serialized bytes are also stored on the synapse for transmission.
 
         Args:
             - automaton (np.ndarray): The automaton as a numpy array.
+            - hash_alg (str): The integrity hash to use, one of HASH_ALGORITHMS.
 
         Returns:
             - automaton_bytes (bytes): The serialized automaton bytes.
@@ -167,52 +309,78 @@ class CAsynapse(bt.Synapse):
         if not isinstance(automaton, np.ndarray):
             raise ValueError("automaton must be a numpy array")
 
-        automaton_bytes = automaton.tobytes()
-        automaton_hash = hashlib.sha256(automaton_bytes).hexdigest()
+        automaton = _as_state(automaton)
+        automaton_buffer, packed = _pack_cells(automaton)
+        automaton_hash = _hash(automaton_buffer, hash_alg)
         automaton_metadata = {
             "dtype": str(automaton.dtype),
             "shape": automaton.shape,
+            "packed": packed,
             "hash": automaton_hash,
+            "hash_alg": hash_alg,
         }
 
-        automaton_metadata_bytes = json.dumps(automaton_metadata).encode("utf-8")
+        automaton_metadata_bytes = _pack_metadata(automaton_metadata)
+        automaton_bytes = bytes(automaton_buffer)
+
+        self.automaton_bytes = automaton_bytes
+        self.automaton_metadata_bytes = automaton_metadata_bytes
         return automaton_bytes, automaton_metadata_bytes
 
     def deserialize_automaton(
-        self, automaton_metadata_bytes: bytes, automaton_bytes: bytes
+        self,
+        automaton_metadata_bytes: typing.Optional[bytes] = None,
+        automaton_bytes: typing.Optional[bytes] = None,
+        verify: typing.Optional[bool] = None,
     ) -> np.ndarray:
         """
         Deserialize the automaton and return the numpy array.
 
         Args:
-            automaton_metadata_bytes (bytes): The serialized metadata of the automaton.
-            automaton_bytes (bytes): The serialized automaton.
+            automaton_metadata_bytes (bytes, optional): The serialized metadata of the automaton.
+                Defaults to the automaton_metadata_bytes carried by the synapse.
+            automaton_bytes (bytes, optional): The serialized automaton.
+                Defaults to the automaton_bytes carried by the synapse.
+            verify (bool, optional): Whether to check the automaton against the metadata hash.
+                Defaults to VERIFY_HASH.
 
         Returns:
             np.ndarray: The deserialized automaton as a numpy array.
 
         Raises:
-            ValueError: Data integrity error if the automaton hash does not match the hash in the metadata.
+            ValueError: Data integrity error if verifying and the automaton hash does not match the hash in the metadata.
         """
-
-        automaton_metadata = json.loads(automaton_metadata_bytes.decode("utf-8"))
-        automaton_hash = hashlib.sha256(automaton_bytes).hexdigest()
-        if automaton_hash != automaton_metadata.get("hash", ""):
+        if automaton_metadata_bytes is None:
+            automaton_metadata_bytes = self.automaton_metadata_bytes
+        if automaton_bytes is None:
+            automaton_bytes = self.automaton_bytes
+
+        automaton_metadata = _unpack_metadata(automaton_metadata_bytes)
+        if verify is None:
+            verify = VERIFY_HASH
+        if verify and not _verify_hash(automaton_bytes, automaton_metadata):
             raise ValueError("Data integrity check failed!")
 
-        automaton = np.frombuffer(
-            automaton_bytes, dtype=np.dtype(automaton_metadata["dtype"])
-        )
-        automaton = automaton.reshape(automaton_metadata["shape"])
+        return _unpack_cells(automaton_bytes, automaton_metadata)
+
+    def deserialize(self) -> typing.Optional[np.ndarray]:
+        """
+        Deserialize the miner response. This is what dendrite.query() returns for each miner when
+        called with deserialize=True.
 
-        return automaton
+        Returns:
+            np.ndarray: The evolved automaton, or None if the miner did not return one.
+        """
+        if self.automaton_bytes is None or self.automaton_metadata_bytes is None:
+            return None
+        return self.deserialize_automaton()
 
     def __str__(self):
         return (
-            f"CAsynapse(array_bytes={self.array_bytes[:12]}, "
-            f"metadata_bytes={self.metadata_bytes[:12]}, "
-            f"automaton_bytes={self.automaton_bytes[:12]}, "
-            f"automaton_metadata_bytes={self.automaton_metadata_bytes[:12]}, "
+            f"CAsynapse(array_bytes={_head(self.array_bytes)}, "
+            f"metadata_bytes={_head(self.metadata_bytes)}, "
+            f"automaton_bytes={_head(self.automaton_bytes)}, "
+            f"automaton_metadata_bytes={_head(self.automaton_metadata_bytes)}, "
             f"axon={self.axon.dict()}, "
             f"dendrite={self.dendrite.dict()}"
         )
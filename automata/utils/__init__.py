@@ -1,5 +1,7 @@
-from . import config
 from . import misc
 from . import uids
 from . import weights
 from . import rulesets
+from . import kernels
+from . import bitboard
+from . import gpu
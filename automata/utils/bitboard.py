@@ -0,0 +1,331 @@
+# The MIT License (MIT)
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+import numpy as np
+from numba import njit, prange
+from numpy.typing import NDArray
+
+# Bit-packed ("bitboard") representation of binary 2D automata: each row is
+# stored as uint64 words holding 64 cells each, column j living in bit j % 64
+# of word j // 64. The unused high bits of the last word of a row are kept at
+# zero. Neighbour counts are computed for all 64 cells of a word at once with
+# a tree of bit-sliced full adders, so a single word operation advances 64
+# cells.
+
+_ONE = np.uint64(1)
+_HIGH_BIT = np.uint64(63)
+
+# Temporal blocking for life_evolve: rows per band, generations per sweep.
+BAND_ROWS = 128
+TIME_BLOCK = 8
+
+# Specialized Life-like kernels, keyed by (birth, survive).
+_LIFE_KERNELS = {}
+
+
+def pack_grid(grid: NDArray) -> NDArray[np.uint64]:
+    """
+    Pack a (H, W) grid of {0, 1} cells into (H, ceil(W / 64)) uint64 words.
+
+    Args:
+        grid (NDArray): The grid to pack.
+
+    Returns:
+        NDArray[np.uint64]: The bit-packed grid.
+    """
+    H, W = grid.shape
+    packed = np.zeros((H, 8 * ((W + 63) // 64)), dtype=np.uint8)
+    packed[:, : (W + 7) // 8] = np.packbits(
+        grid.astype(bool), axis=1, bitorder="little"
+    )
+    return packed.view("<u8").astype(np.uint64, copy=False)
+
+
+def unpack_grid(words: NDArray[np.uint64], width: int) -> NDArray[np.uint8]:
+    """
+    Unpack bit-packed words back into a (H, width) grid of uint8 cells.
+
+    Args:
+        words (NDArray[np.uint64]): The bit-packed grid.
+        width (int): The number of cells per row.
+
+    Returns:
+        NDArray[np.uint8]: The unpacked grid.
+    """
+    packed = words.astype("<u8", copy=False).view(np.uint8)
+    return np.unpackbits(packed, axis=1, count=width, bitorder="little")
+
+
+@njit(inline="always", cache=True)
+def _full_add(a, b, c):
+    """Return the per-lane sum and carry bits of a + b + c."""
+    t = a ^ b
+    return t ^ c, (a & b) | (t & c)
+
+
+@njit(inline="always", cache=True)
+def _west_east(row, k, last_bit):
+    """
+    Return the west and east neighbours of every lane of word k of a packed
+    row, carrying across word boundaries and wrapping between column 0 and
+    column width - 1.
+    """
+    last = row.shape[0] - 1
+    if k > 0:
+        west = (row[k] << _ONE) | (row[k - 1] >> _HIGH_BIT)
+    else:
+        west = (row[k] << _ONE) | ((row[last] >> last_bit) & _ONE)
+    if k < last:
+        east = (row[k] >> _ONE) | (row[k + 1] << _HIGH_BIT)
+    else:
+        east = (row[k] >> _ONE) | ((row[0] & _ONE) << last_bit)
+    return west, east
+
+
+def life_step(words, out, birth, survive, width):
+    """
+    Advance a bit-packed Life-like grid by one generation with periodic
+    boundaries.
+
+    Args:
+        words (NDArray[np.uint64]): The current generation, as produced by
+            pack_grid.
+        out (NDArray[np.uint64]): The buffer to write the next generation to.
+        birth (int): Bit n is set if a dead cell with n live neighbours is
+            born.
+        survive (int): Bit n is set if a live cell with n live neighbours
+            survives.
+        width (int): The number of cells per row.
+    """
+    _life_kernels(birth, survive)[0](words, out, width)
+
+
+def life_evolve(words, out, steps, birth, survive, width):
+    """
+    Advance a bit-packed Life-like grid by several generations with periodic
+    boundaries, writing only the final one.
+
+    The grid is swept in bands of BAND_ROWS rows, each advanced TIME_BLOCK
+    generations at a time in a private buffer holding the band plus TIME_BLOCK
+    halo rows on either side. The valid region shrinks by a row per generation,
+    so the band is still exact after the block, and each row is read from
+    memory once per TIME_BLOCK generations instead of once per generation.
+    Bands are processed in parallel.
+
+    Args:
+        words (NDArray[np.uint64]): The starting generation, as produced by
+            pack_grid.
+        out (NDArray[np.uint64]): The buffer to write the final generation to.
+        steps (int): The number of generations to advance.
+        birth (int): Bit n is set if a dead cell with n live neighbours is
+            born.
+        survive (int): Bit n is set if a live cell with n live neighbours
+            survives.
+        width (int): The number of cells per row.
+    """
+    _life_kernels(birth, survive)[1](words, out, steps, width)
+
+
+def _life_kernels(birth: int, survive: int):
+    """
+    Return the (step, evolve) kernels for the Life-like rule with the given
+    birth/survive masks, compiling them on first use with the masks baked in
+    as constants, so the rule reduces to a few word operations with no
+    branches.
+    """
+    key = (int(birth), int(survive))
+    kernels = _LIFE_KERNELS.get(key)
+    if kernels is None:
+        kernels = _LIFE_KERNELS[key] = _make_life_kernels(*key)
+    return kernels
+
+
+def _make_life_kernels(birth: int, survive: int):
+    @njit(inline="always", cache=True)
+    def step_row(up, mid, dn, out, last_bit):
+        last = mid.shape[0] - 1
+        # Mask of the bits in use in the last word, which holds column
+        # width - 1 at last_bit.
+        tail_mask = ~np.uint64(0) >> (_HIGH_BIT - last_bit)
+        for k in range(last + 1):
+            # Sum each row's neighbours into two bits, then the three row sums
+            # into the four bits s0..s3 of the neighbour count.
+            west, east = _west_east(up, k, last_bit)
+            up_ones, up_twos = _full_add(west, up[k], east)
+            west, east = _west_east(mid, k, last_bit)
+            mid_ones, mid_twos = west ^ east, west & east
+            west, east = _west_east(dn, k, last_bit)
+            dn_ones, dn_twos = _full_add(west, dn[k], east)
+
+            s0, carry = _full_add(up_ones, mid_ones, dn_ones)
+            twos, fours = _full_add(up_twos, mid_twos, dn_twos)
+            s1 = twos ^ carry
+            carry &= twos
+            s2 = fours ^ carry
+            s3 = fours & carry
+
+            alive = mid[k]
+            nxt = np.uint64(0)
+            for n in range(9):
+                born = (birth >> n) & 1
+                survives = (survive >> n) & 1
+                if born or survives:
+                    eq = (s0 if n & 1 else ~s0) & (s1 if n & 2 else ~s1)
+                    eq &= (s2 if n & 4 else ~s2) & (s3 if n & 8 else ~s3)
+                    if born and survives:
+                        nxt |= eq
+                    elif born:
+                        nxt |= eq & ~alive
+                    else:
+                        nxt |= eq & alive
+            if k == last:
+                nxt &= tail_mask
+            out[k] = nxt
+
+    @njit(parallel=True, cache=True)
+    def step(words, out, width):
+        H = words.shape[0]
+        last_bit = np.uint64((width - 1) % 64)
+        for i in prange(H):
+            step_row(
+                words[(i - 1) % H],
+                words[i],
+                words[(i + 1) % H],
+                out[i],
+                last_bit,
+            )
+
+    @njit(parallel=True, cache=True)
+    def evolve(words, out, steps, width):
+        H, nw = words.shape
+        last_bit = np.uint64((width - 1) % 64)
+        n_bands = (H + BAND_ROWS - 1) // BAND_ROWS
+
+        if n_bands == 1:
+            # A single band fits in cache whole; stepping it in place skips
+            # the halo recomputation and the per-block thread launches, which
+            # dominate on small grids.
+            src = words.copy()
+            dst = out
+            for _ in range(steps):
+                for i in range(H):
+                    step_row(
+                        src[(i - 1) % H],
+                        src[i],
+                        src[(i + 1) % H],
+                        dst[i],
+                        last_bit,
+                    )
+                src, dst = dst, src
+            if src is not out:
+                out[:] = src
+            return
+
+        out[:] = words
+        src = out
+        dst = np.empty_like(words)
+        done = 0
+        while done < steps:
+            K = min(TIME_BLOCK, steps - done)
+            for b in prange(n_bands):
+                start = b * BAND_ROWS
+                rows = min(BAND_ROWS, H - start)
+                span = rows + 2 * K
+                cur = np.empty((span, nw), dtype=np.uint64)
+                nxt = np.empty((span, nw), dtype=np.uint64)
+                for r in range(span):
+                    cur[r] = src[(start - K + r) % H]
+                for s in range(1, K + 1):
+                    for r in range(s, span - s):
+                        step_row(
+                            cur[r - 1], cur[r], cur[r + 1], nxt[r], last_bit
+                        )
+                    cur, nxt = nxt, cur
+                for r in range(rows):
+                    dst[start + r] = cur[K + r]
+            src, dst = dst, src
+            done += K
+
+        if done and src is not out:
+            out[:] = src
+
+    return step, evolve
+
+
+@njit(cache=True)
+def elementary_step(row, out, rule, width):
+    """
+    Advance a bit-packed elementary (r=1, two-state) 1D automaton by one
+    generation with periodic boundaries.
+
+    The next state of every lane is the OR, over the neighbourhood patterns the
+    rule maps to 1, of the lanes whose (left, centre, right) cells match that
+    pattern.
+
+    Args:
+        row (NDArray[np.uint64]): The current generation, as a single row of
+            pack_grid.
+        out (NDArray[np.uint64]): The buffer to write the next generation to.
+        rule (int): The Wolfram rule number; bit (left << 2 | centre << 1 |
+            right) of it is the next state of a cell with that neighbourhood.
+        width (int): The number of cells in the row.
+    """
+    last = row.shape[0] - 1
+    last_bit = np.uint64((width - 1) % 64)
+    tail_mask = ~np.uint64(0) >> (_HIGH_BIT - last_bit)
+    for k in range(last + 1):
+        # West holds each cell's left neighbour and east its right neighbour.
+        left, right = _west_east(row, k, last_bit)
+        centre = row[k]
+        nxt = np.uint64(0)
+        for pattern in range(8):
+            if (rule >> pattern) & 1:
+                nxt |= (
+                    (left if pattern & 4 else ~left)
+                    & (centre if pattern & 2 else ~centre)
+                    & (right if pattern & 1 else ~right)
+                )
+        if k == last:
+            nxt &= tail_mask
+        out[k] = nxt
+
+
+@njit(cache=True)
+def elementary_evolve(row, history, rule):
+    """
+    Evolve a bit-packed elementary automaton through a whole history with
+    periodic boundaries, unpacking every generation after the first into it.
+
+    Args:
+        row (NDArray[np.uint64]): The starting generation, as a single row of
+            pack_grid.
+        history (NDArray[np.uint8]): A (timesteps, width) buffer whose first
+            row already holds the starting generation.
+        rule (int): The Wolfram rule number.
+    """
+    width = history.shape[1]
+    current = row.copy()
+    following = np.empty_like(current)
+    for t in range(1, history.shape[0]):
+        elementary_step(current, following, rule, width)
+        out = history[t]
+        for k in range(following.shape[0]):
+            word = following[k]
+            start = 64 * k
+            for b in range(min(64, width - start)):
+                out[start + b] = (word >> np.uint64(b)) & _ONE
+        current, following = following, current
@@ -0,0 +1,202 @@
+# The MIT License (MIT)
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+import math
+from typing import Optional
+
+import numpy as np
+from numba import cuda, int32, uint8
+from numpy.typing import NDArray
+
+from automata.utils import kernels
+
+# Threads per block along (rows, columns); each block stages a (BY + 2, BX + 2)
+# tile.
+BY, BX = 16, 16
+
+# Register/shuffle kernel layout: each warp spans WARP_SIZE columns, of which
+# the first and last lanes only load halo cells, and each thread keeps
+# ROWS_PER_THREAD cells of its column (plus a halo row above and below) in
+# registers. SHFL_WARPS warps are stacked vertically per block.
+WARP_SIZE = 32
+ROWS_PER_THREAD = 8
+SHFL_WARPS = 4
+_FULL_MASK = 0xFFFFFFFF
+
+
+def is_available() -> bool:
+    """Whether a CUDA device can be used for stepping grids."""
+    return cuda.is_available()
+
+
+@cuda.jit
+def life_kernel(g_in, g_out, table):
+    """
+    Advance a Life-like grid by one generation on the GPU, one thread per cell.
+
+    Each block first stages its tile plus a one-cell halo (wrapped at the grid
+    edges) in shared memory, so the eight neighbour reads of every thread hit
+    shared memory only. The rule is given as an 18-bit table, birth mask in the
+    low 9 bits and survive mask above them, so the next state is a single
+    branch-free lookup.
+    """
+    H, W = g_in.shape
+    tile = cuda.shared.array((BY + 2, BX + 2), uint8)
+
+    ty = cuda.threadIdx.y
+    tx = cuda.threadIdx.x
+    row0 = cuda.blockIdx.y * BY - 1
+    col0 = cuda.blockIdx.x * BX - 1
+
+    # Cooperative strided load, which also covers the halo and partial edge
+    # blocks.
+    for k in range(ty * BX + tx, (BY + 2) * (BX + 2), BY * BX):
+        r = k // (BX + 2)
+        c = k % (BX + 2)
+        tile[r, c] = g_in[(row0 + r) % H, (col0 + c) % W]
+    cuda.syncthreads()
+
+    j, i = cuda.grid(2)
+    if i >= H or j >= W:
+        return
+
+    r = ty + 1
+    c = tx + 1
+    n = (
+        tile[r - 1, c - 1]
+        + tile[r - 1, c]
+        + tile[r - 1, c + 1]
+        + tile[r, c - 1]
+        + tile[r, c + 1]
+        + tile[r + 1, c - 1]
+        + tile[r + 1, c]
+        + tile[r + 1, c + 1]
+    )
+    g_out[i, j] = (table >> (int(n) + 9 * int(tile[r, c]))) & 1
+
+
+@cuda.jit
+def life_kernel_shfl(g_in, g_out, table):
+    """
+    Advance a Life-like grid by one generation on the GPU, keeping the stencil
+    in registers.
+
+    Each thread loads a column strip of ROWS_PER_THREAD + 2 cells into
+    registers, then takes the cells to its left and right from the neighbouring
+    lanes of its warp with shuffles, so no shared memory is needed. Vertical
+    neighbours come from the thread's own strip. Warps overlap by two columns,
+    so the outermost lanes only supply halo values.
+    """
+    H, W = g_in.shape
+    lane = cuda.threadIdx.x
+    j = cuda.blockIdx.x * (WARP_SIZE - 2) + lane - 1
+    i0 = (
+        cuda.blockIdx.y * cuda.blockDim.y + cuda.threadIdx.y
+    ) * ROWS_PER_THREAD
+
+    cells = cuda.local.array(ROWS_PER_THREAD + 2, int32)
+    row_sums = cuda.local.array(ROWS_PER_THREAD + 2, int32)
+    col = j % W
+    for r in range(ROWS_PER_THREAD + 2):
+        cells[r] = g_in[(i0 - 1 + r) % H, col]
+    # Every lane takes part in the shuffles, including those outside the grid.
+    for r in range(ROWS_PER_THREAD + 2):
+        v = cells[r]
+        left = cuda.shfl_up_sync(_FULL_MASK, v, 1)
+        right = cuda.shfl_down_sync(_FULL_MASK, v, 1)
+        row_sums[r] = left + v + right
+
+    if lane == 0 or lane == WARP_SIZE - 1 or j >= W:
+        return
+    for r in range(1, ROWS_PER_THREAD + 1):
+        i = i0 + r - 1
+        if i < H:
+            cell = cells[r]
+            n = row_sums[r - 1] + row_sums[r] + row_sums[r + 1] - cell
+            g_out[i, j] = (table >> (n + 9 * cell)) & 1
+
+
+def _launch_config(shape) -> tuple:
+    H, W = shape
+    return (math.ceil(W / BX), math.ceil(H / BY)), (BX, BY)
+
+
+def _launch_config_shfl(shape) -> tuple:
+    H, W = shape
+    rows_per_block = SHFL_WARPS * ROWS_PER_THREAD
+    blocks = (math.ceil(W / (WARP_SIZE - 2)), math.ceil(H / rows_per_block))
+    return blocks, (WARP_SIZE, SHFL_WARPS)
+
+
+def life_evolve(
+    grid: NDArray[np.uint8],
+    timesteps: int,
+    birth: int,
+    survive: int,
+    history: Optional[NDArray[np.uint8]] = None,
+    shuffle: bool = True,
+) -> NDArray[np.uint8]:
+    """
+    Evolve a Life-like grid for timesteps - 1 generations on the GPU.
+
+    The two generation buffers stay resident on the device between steps;
+    generations are only copied back to the host when a history is being kept,
+    and at the end.
+
+    Falls back to the Numba CPU kernel when no CUDA device is available.
+
+    Args:
+        grid (NDArray[np.uint8]): The starting grid, with cells in {0, 1}.
+        timesteps (int): The number of generations, including the starting one.
+        birth (int): Bit n is set if a dead cell with n live neighbours is
+            born.
+        survive (int): Bit n is set if a live cell with n live neighbours
+            survives.
+        history (NDArray[np.uint8], optional): A (timesteps, H, W) buffer to
+            copy every generation after the first into.
+        shuffle (bool): Use the register/warp-shuffle kernel rather than the
+            shared-memory one.
+
+    Returns:
+        NDArray[np.uint8]: The final generation.
+    """
+    grid = np.ascontiguousarray(grid, dtype=np.uint8)
+    if not cuda.is_available():
+        step = kernels.life_kernel(birth, survive)
+        current, following = grid.copy(), np.empty_like(grid)
+        for t in range(1, timesteps):
+            step(current, following)
+            if history is not None:
+                history[t] = following
+            current, following = following, current
+        return current
+
+    table = birth | (survive << 9)
+    if shuffle:
+        kernel = life_kernel_shfl
+        blocks, threads = _launch_config_shfl(grid.shape)
+    else:
+        kernel = life_kernel
+        blocks, threads = _launch_config(grid.shape)
+    current = cuda.to_device(grid)
+    following = cuda.device_array_like(current)
+    for t in range(1, timesteps):
+        kernel[blocks, threads](current, following, table)
+        if history is not None:
+            following.copy_to_host(history[t])
+        current, following = following, current
+    return current.copy_to_host()
@@ -15,13 +15,16 @@
 # DEALINGS IN THE SOFTWARE.
 
 
-from typing import Any, Callable
+import struct
+from typing import Any, Callable, Optional
 import numpy as np
 from numpy.typing import NDArray
 import cellpylib as cpl
 import bittensor as bt
 from abc import ABC, abstractmethod
 
+from automata.utils import bitboard, gpu, kernels
+
 
 class ApplyRule(ABC):
     """Abstract class for application of cellular automata rules"""
@@ -31,68 +34,181 @@ class ApplyRule(ABC):
         pass
 
 
+# Relative (row, col) offsets of the cells surrounding a cell for r=1.
+MOORE_OFFSETS = tuple(
+    (dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if (dy, dx) != (0, 0)
+)
+VON_NEUMANN_OFFSETS = ((-1, 0), (0, -1), (0, 1), (1, 0))
+
+
+def _wrap_slices(shift: int):
+    """Destination/source slice pairs that shift an axis by -1, 0 or 1 with wrap-around."""
+    if shift == 0:
+        return ((slice(None), slice(None)),)
+    if shift == 1:
+        return ((slice(1, None), slice(None, -1)), (slice(0, 1), slice(-1, None)))
+    return ((slice(None, -1), slice(1, None)), (slice(-1, None), slice(0, 1)))
+
+
+def neighbour_count(
+    grid: NDArray, neighbourhood: str = "Moore", out: Optional[NDArray] = None
+) -> NDArray[np.uint8]:
+    """
+    Count the live neighbours of every cell of a 2D grid with periodic boundaries.
+
+    Each neighbour is accumulated as np.roll(grid, offset) would shift it, but by adding
+    the wrapped slices in place, so no shifted copies of the grid are allocated. Only the
+    last two axes are treated as spatial, so a (B, H, W) batch of grids is counted at once.
+
+    Args:
+        grid (NDArray): The current state of the grid (or batch of grids), with cells in {0, 1}.
+        neighbourhood (str): The type of neighbourhood to use, "Moore" or "von Neumann".
+        out (NDArray, optional): A uint8 buffer to accumulate the counts into.
+
+    Returns:
+        NDArray[np.uint8]: The number of live neighbours of each cell, excluding the cell itself.
+    """
+    offsets = VON_NEUMANN_OFFSETS if neighbourhood == "von Neumann" else MOORE_OFFSETS
+    if out is None:
+        out = np.zeros(grid.shape, dtype=np.uint8)
+    else:
+        out.fill(0)
+    for dy, dx in offsets:
+        for dst_rows, src_rows in _wrap_slices(dy):
+            for dst_cols, src_cols in _wrap_slices(dx):
+                dst = out[..., dst_rows, dst_cols]
+                np.add(dst, grid[..., src_rows, src_cols], out=dst, casting="unsafe")
+    return out
+
+
+def _out_for(grid: NDArray, out: Optional[NDArray]) -> NDArray[np.uint8]:
+    """Return the buffer a whole-grid step should write to, allocating one if none was given."""
+    return np.empty(grid.shape, dtype=np.uint8) if out is None else out
+
+
+def to_ascii(grid: NDArray, alive: str = "#", dead: str = ".") -> str:
+    """
+    Render a CA state or history as text, one line per row of the last axis.
+
+    The characters are picked for the whole array at once and the rows are emitted as a single
+    byte buffer, instead of building the string one cell at a time.
+
+    Args:
+        grid (NDArray): A 1D row, 2D grid or history; leading axes are stacked as extra rows.
+        alive (str): Single ASCII character drawn for non-zero cells.
+        dead (str): Single ASCII character drawn for zero cells.
+
+    Returns:
+        str: The rows joined by newlines.
+    """
+    grid = np.asarray(grid)
+    rows = grid.reshape(-1, grid.shape[-1]).astype(bool)
+    chars = np.empty((rows.shape[0], rows.shape[1] + 1), dtype=np.uint8)
+    chars[:, :-1] = np.where(rows, ord(alive), ord(dead))
+    chars[:, -1] = ord("\n")
+    return chars.tobytes()[:-1].decode("ascii")
+
+
 import numpy as np
 
 class InitialConditions:
-    def __init__(self, size: int, percentage: float):
+    def __init__(self, size: int, percentage: float, seed: Optional[int] = None):
         self.size = size
         self.percentage = percentage
+        # One PCG64 generator per instance: faster than the legacy global Mersenne Twister and
+        # reproducible when seeded.
+        self.rng = np.random.default_rng(seed)
 
     def init_random_1d(self):
         # Calculate the number of cells to be activated
         num_cells = 1 #int(self.size * self.percentage)
         # Create a flat array with the desired number of 1s and 0s
-        initial_state = np.array([1]*num_cells + [0]*(self.size - num_cells))
+        initial_state = np.array([1]*num_cells + [0]*(self.size - num_cells), dtype=np.uint8)
         # Randomly shuffle the array. Maybe we dont want this, and can use cpl.init_random or cpl.init_simple
-        np.random.shuffle(initial_state)
+        self.rng.shuffle(initial_state)
         return initial_state
 
     def init_random_2d(self, rows: int, cols: int):
         # Calculate the number of cells to be activated
         num_cells = int(rows * cols * self.percentage)
         # Create a flat array with the desired number of 1s and 0s
-        cells = np.array([1]*num_cells + [0]*(rows*cols - num_cells))
+        cells = np.array([1]*num_cells + [0]*(rows*cols - num_cells), dtype=np.uint8)
         # Randomly shuffle the array
-        np.random.shuffle(cells)
+        self.rng.shuffle(cells)
         # Reshape the array to the size of the grid
         initial_state = cells.reshape(1, rows, cols)
         return initial_state
 
 
-class ConwayRule(ApplyRule):
+class LifeLikeRule(ApplyRule):
+    """Base class for two-state rules defined by the neighbour counts that give birth or survival."""
+
+    # Bit n is set if a cell with n live neighbours is born (dead) or survives (alive).
+    birth = 0
+    survive = 0
+
+    def rule_function(self, n, c, t):
+        center = int(n[n.shape[0] // 2, n.shape[1] // 2])
+        sum_n = int(n.sum()) - center
+        return ((self.survive if center else self.birth) >> sum_n) & 1
+
+
+class ConwayRule(LifeLikeRule):
     """Implementation of Conway's Game of Life:
     a cellular automaton where a cell is "born" if it has exactly three neighbors,
     and a cell "survives" if it has exactly two or three neighbors. Otherwise,
     the cell dies or remains dead."""
 
-    def rule_function(self, n, c, t):
-        sum_n = np.sum(n)
-        return int(c and 2 <= sum_n <= 3 or sum_n == 3)
+    birth = 0b000001000
+    survive = 0b000001100
+
+    def step(
+        self, grid: NDArray, neighbourhood: str = "Moore", out: Optional[NDArray] = None
+    ) -> NDArray[np.uint8]:
+        n = neighbour_count(grid, neighbourhood)
+        return np.logical_or(n == 3, (grid == 1) & (n == 2), out=_out_for(grid, out))
 
 
-class HighLifeRule(ApplyRule):
+class HighLifeRule(LifeLikeRule):
     """Implementation of Game of Life HighLife:
     a variant of Conway's Game of Life that also gives birth to a cell if there are 6 neighbors.
     """
 
-    def rule_function(self, n, c, t):
-        sum_n = np.sum(n)
-        return int(c and 2 <= sum_n <= 3 or sum_n == 6)
+    birth = 0b001001000
+    survive = 0b000001100
+
+    def step(
+        self, grid: NDArray, neighbourhood: str = "Moore", out: Optional[NDArray] = None
+    ) -> NDArray[np.uint8]:
+        n = neighbour_count(grid, neighbourhood)
+        alive = grid == 1
+        born = ~alive & ((n == 3) | (n == 6))
+        survive = alive & ((n == 2) | (n == 3))
+        return np.logical_or(born, survive, out=_out_for(grid, out))
 
 
-class DayAndNightRule(ApplyRule):
+class DayAndNightRule(LifeLikeRule):
     """Implementation of Day & Night: a variant of Conway's Game of Life
     that also gives birth to a cell if there are 3, 6, 7, or 8 neighbors."""
 
-    def rule_function(self, n, c, t):
-        sum_n = np.sum(n)
-        return sum_n in (3, 6, 7, 8) or c and sum_n in (4, 6, 7, 8)
+    birth = 0b111001000
+    survive = 0b111011000
+
+    def step(
+        self, grid: NDArray, neighbourhood: str = "Moore", out: Optional[NDArray] = None
+    ) -> NDArray[np.uint8]:
+        n = neighbour_count(grid, neighbourhood)
+        born = (n == 3) | (n >= 6)
+        survive = (grid == 1) & ((n == 4) | (n >= 6))
+        return np.logical_or(born, survive, out=_out_for(grid, out))
 
 
 class Rule30(ApplyRule):
     """Implementation of a one-dimensional cellular automaton rule introduced by Stephen Wolfram,
     known for its chaotic behavior."""
 
+    rule_number = 30
+
     def rule_function(self, n: NDArray, c: int, t: int) -> int:
         return cpl.nks_rule(n, 30)
 
@@ -101,18 +217,26 @@ class Rule110(ApplyRule):
     """Implementation of Rule 110: It's another one-dimensional cellular automaton rule,
     introduced by Stephen Wolfram. It's known for being Turing complete."""
 
+    rule_number = 110
+
     def rule_function(self, n: NDArray, c: int, t: int) -> int:
         return cpl.nks_rule(n, 110)
 
 
-class FredkinRule(ApplyRule):
+class FredkinRule(LifeLikeRule):
     """Implementation of Fredkin's is a cellular automaton rule where a cell is "born" if it has exactly one neighbor,
     and a cell "survives" if it has exactly two neighbors. Otherwise, the cell dies or remains dead.
     """
 
-    def rule_function(self, n, c, t):
-        sum_n = np.sum(n)
-        return sum_n == 1 or c and sum_n == 2
+    birth = 0b000000010
+    survive = 0b000000100
+
+    def step(
+        self, grid: NDArray, neighbourhood: str = "Moore", out: Optional[NDArray] = None
+    ) -> NDArray[np.uint8]:
+        n = neighbour_count(grid, neighbourhood)
+        alive = grid == 1
+        return np.logical_or(~alive & (n == 1), alive & (n == 2), out=_out_for(grid, out))
 
 
 class BriansBrainRule(ApplyRule):
@@ -120,72 +244,98 @@ class BriansBrainRule(ApplyRule):
     A cell is "born" if it was dead and has exactly two neighbors.
     A live cell dies in the next generation, and a dead cell remains dead."""
 
+    # Next state indexed by [state][number of firing neighbours, capped at 3].
+    NEXT_STATE = (
+        (0, 0, 1, 0),
+        (2, 2, 2, 2),
+        (0, 0, 0, 0),
+    )
+
     def rule_function(self, n, c, t):
-        sum_n = np.sum(n)
-        if c == 0 and sum_n == 2:
-            return 1
-        elif c == 1:
-            return 2
-        elif c == 2:
-            return 0
-        else:
-            return 0  # or any other default value
-
-
-class SeedsRule(ApplyRule):
+        center = int(n[n.shape[0] // 2, n.shape[1] // 2])
+        # Only firing (state 1) neighbours count.
+        sum_n = int((n == 1).sum()) - (center == 1)
+        return self.NEXT_STATE[center][min(sum_n, 3)]
+
+    def step(
+        self, grid: NDArray, neighbourhood: str = "Moore", out: Optional[NDArray] = None
+    ) -> NDArray[np.uint8]:
+        firing = grid == 1
+        n = neighbour_count(firing.view(np.uint8), neighbourhood)
+        out = _out_for(grid, out)
+        # Firing cells start dying (2), dying cells go dark (0), dark cells fire on two neighbours.
+        np.multiply(firing, 2, out=out, casting="unsafe")
+        out |= (grid == 0) & (n == 2)
+        return out
+
+
+class SeedsRule(LifeLikeRule):
     """Implementation of Seeds is a cellular automaton where a cell is "born" if it has exactly two neighbors,
     and a cell "dies" otherwise."""
 
-    def rule_function(self, n, c, t):
-        sum_n = np.sum(n)
-        return int(sum_n == 2)
+    birth = 0b000000100
+    survive = 0b000000000
+
+    def step(
+        self, grid: NDArray, neighbourhood: str = "Moore", out: Optional[NDArray] = None
+    ) -> NDArray[np.uint8]:
+        n = neighbour_count(grid, neighbourhood)
+        return np.logical_and(grid == 0, n == 2, out=_out_for(grid, out))
+
+
+# Shared instances of the 2D rules, keyed by the rule names used in CAsynapse requests. The rules
+# are stateless, so Simulate can be handed the same instance (and bound rule_function) every time.
+RULES = {
+    "Conway": ConwayRule(),
+    "HighLife": HighLifeRule(),
+    "DayAndNight": DayAndNightRule(),
+    "Fredkin": FredkinRule(),
+    "BriansBrain": BriansBrainRule(),
+    "Seeds": SeedsRule(),
+}
 
 
 class ByteTransfer(bt.Synapse):
     """A synapse that verifies the integrity of a simulation"""
 
     @staticmethod
-    def deserialize(bytes: bytes) -> [NDArray[np.float64]]:
+    def deserialize(buf: bytes) -> Optional[NDArray[np.uint8]]:
         """
         Deserialize the simulation output. This method retrieves the result of
         the CA simulation from the miner in the form of simulation_output,
         deserializes it and returns it as the output of the dendrite.query() call.
-        This should be more efficient for numerical ops than a list
+        The array is a read-only view over the received buffer; nothing is copied.
 
         Returns:
         - np.ndarray: The deserialized response, which in this case is the value of simulation_output.
         """
-        # Check if the data is not None and deserialize it
-        if not isinstance(bytes):
+        if buf is None:
+            return None
+        if not isinstance(buf, (bytes, bytearray, memoryview)):
             raise ValueError("Data must be bytes")
-        if bytes is not None:
-            deserialized = np.frombuffer(bytes, dtype=np.int).reshape(-1, 100)
-            data = deserialized.astype(np.float64)
 
-            # Validate the deserialized data (if necessary)
-
-            return data
-        return None
+        ndim = buf[0]
+        shape = struct.unpack_from(f"<{ndim}I", buf, 1)
+        return np.frombuffer(buf, dtype=np.uint8, offset=1 + 4 * ndim).reshape(shape)
 
     @staticmethod
-    def serialize(data: NDArray[np.float64]) -> bytes:
+    def serialize(data: NDArray) -> bytes:
         """
         Serialize the simulation output. This method serializes the result of
         the CA simulation and returns it as the output of the dendrite.query() call.
+        The cells are sent as uint8 after a header of one byte for the number of
+        dimensions and a little-endian uint32 per dimension.
 
         Returns:
         - bytes: The serialized response, which in this case is the value of simulation_output.
         """
-        # Check if the data is not None and serialize it
         if not isinstance(data, np.ndarray):
             raise ValueError("Data must be np.ndarray")
-        if data is not None:
-            serialized = data.tobytes()
 
-            # Validate the serialized data (if necessary)
+        header = struct.pack(f"<B{data.ndim}I", data.ndim, *data.shape)
+        return header + np.ascontiguousarray(data, dtype=np.uint8).tobytes()
+
 
-        return serialized
-    
 class Simulate:
     """Main simulation runner for CA used in miner and validator routines"""
 
@@ -196,9 +346,14 @@ class Simulate:
         rule_instance: ApplyRule,
         r: int = 1,
         neighbourhood_type: str = "Moore",
+        device: str = "cpu",
+        plot: bool = False,
     ):
 
-        if neighbourhood_type not in ["Moore", "von Neumann"]:
+        # Match the name case-insensitively: validators have sent "Von Neumann".
+        if str(neighbourhood_type).lower() == "von neumann":
+            neighbourhood_type = "von Neumann"
+        elif neighbourhood_type != "Moore":
             neighbourhood_type = "Moore"  # default to "Moore" if input is not valid
 
         self.ca = ca
@@ -206,22 +361,180 @@ class Simulate:
         self.rule_instance = rule_instance
         self.r = r
         self.neighborhood_type = neighbourhood_type
+        self.device = device
+        self.plot = plot
 
-    def run(self) -> NDArray[Any]:
+    def run(self, keep_history: bool = True) -> NDArray[Any]:
+        """
+        Run the simulation.
+
+        Args:
+            keep_history (bool): Return every generation as a (timesteps, H, W) array, as
+                cpl.evolve2d does. When False only the final (H, W) generation is returned, and
+                the whole-grid paths step between two buffers instead of filling a history.
+
+        Returns:
+            NDArray: The history of the simulation, or its final generation.
+        """
         try:
-            ca = cpl.evolve2d(
-                cellular_automaton=self.ca,
-                timesteps=self.timesteps,
-                apply_rule=self.rule_instance.rule_function,
-                r=self.r,
-                neighbourhood=self.neighborhood_type,
-            )
+            if self._use_gpu():
+                history = self._history() if keep_history else None
+                ca = gpu.life_evolve(
+                    self._initial_state(),
+                    self.timesteps,
+                    self.rule_instance.birth,
+                    self.rule_instance.survive,
+                    history,
+                )
+                if keep_history:
+                    ca = history
+            elif self._use_bitboard():
+                ca = self._evolve_bitboard(self._history() if keep_history else None)
+            else:
+                # Rules with a whole-grid step bypass cellpylib's per-cell callback.
+                kernel = self._kernel()
+                if kernel is not None:
+                    ca = self._evolve(kernel, self._history() if keep_history else None)
+                else:
+                    ca = cpl.evolve2d(
+                        cellular_automaton=self.ca,
+                        timesteps=self.timesteps,
+                        apply_rule=self.rule_instance.rule_function,
+                        r=self.r,
+                        neighbourhood=self.neighborhood_type,
+                    )
+                    if not keep_history:
+                        ca = ca[-1]
         except Exception as e:
             raise RuntimeError(f"Error running simulation.") from e
 
-        cpl.plot2d_animate(ca)
+        if self.plot and keep_history:
+            cpl.plot2d_animate(ca)
         return ca
 
+    def run_batch(self, grids: NDArray) -> NDArray[np.uint8]:
+        """
+        Evolve a batch of grids with this simulation's rule, timesteps and neighbourhood.
+
+        The rule's whole-grid step is applied to all grids at once, so the per-step Python
+        overhead is paid once for the batch rather than once per grid.
+
+        Args:
+            grids (NDArray): A (B, H, W) stack of starting grids.
+
+        Returns:
+            NDArray[np.uint8]: The (B, H, W) final generation of every grid.
+
+        Raises:
+            ValueError: If the rule has no whole-grid step or the radius is not 1.
+        """
+        step = getattr(self.rule_instance, "step", None)
+        if step is None or self.r != 1:
+            raise ValueError("Batched simulation needs a rule with a whole-grid step and r=1")
+
+        current = np.array(grids, dtype=np.uint8)
+        following = np.empty_like(current)
+        for t in range(1, self.timesteps):
+            step(current, self.neighborhood_type, out=following)
+            current, following = following, current
+        return current
+
+    def _kernel(self) -> Optional[Callable[[NDArray, NDArray], None]]:
+        """Return a whole-grid step writing into an output buffer, or None to use cellpylib."""
+        if self.r != 1:
+            return None
+        if hasattr(self.rule_instance, "birth"):
+            return kernels.life_kernel(
+                self.rule_instance.birth, self.rule_instance.survive, self.neighborhood_type
+            )
+        if isinstance(self.rule_instance, BriansBrainRule) and self.neighborhood_type == "Moore":
+            return kernels.brians_brain_step
+
+        step = getattr(self.rule_instance, "step", None)
+        if step is None:
+            return None
+
+        def kernel(grid: NDArray, out: NDArray) -> None:
+            step(grid, self.neighborhood_type, out=out)
+
+        return kernel
+
+    def _use_gpu(self) -> bool:
+        """Whether the grid should be evolved on a CUDA device; falls back to the CPU otherwise."""
+        return (
+            self.device == "cuda"
+            and gpu.is_available()
+            and self.r == 1
+            and self.neighborhood_type == "Moore"
+            and hasattr(self.rule_instance, "birth")
+        )
+
+    def _use_bitboard(self) -> bool:
+        """Whether the grid can be evolved 64 cells per word with the bitboard kernel."""
+        return (
+            self.r == 1
+            and self.neighborhood_type == "Moore"
+            and hasattr(self.rule_instance, "birth")
+        )
+
+    def _initial_state(self) -> NDArray[np.uint8]:
+        """
+        Return the starting grid. Like cpl.evolve2d, the input may hold a history of previous
+        states, in which case the last one is used.
+        """
+        initial_state = np.asarray(self.ca)
+        if initial_state.ndim == 3:
+            initial_state = initial_state[-1]
+        return np.ascontiguousarray(initial_state, dtype=np.uint8)
+
+    def _history(self) -> NDArray[np.uint8]:
+        """Allocate the evolution history, which includes the initial state like cpl.evolve2d's."""
+        initial_state = self._initial_state()
+        history = np.empty((self.timesteps, *initial_state.shape), dtype=np.uint8)
+        history[0] = initial_state
+        return history
+
+    def _evolve(
+        self, kernel: Callable[[NDArray, NDArray], None], history: Optional[NDArray] = None
+    ) -> NDArray[np.uint8]:
+        """
+        Evolve the grid one whole timestep at a time, into the history if one is given and
+        otherwise ping-ponging between two buffers. Returns the history or the final grid.
+        """
+        if history is not None:
+            for t in range(1, self.timesteps):
+                kernel(history[t - 1], history[t])
+            return history
+
+        current = self._initial_state().copy()
+        following = np.empty_like(current)
+        for t in range(1, self.timesteps):
+            kernel(current, following)
+            current, following = following, current
+        return current
+
+    def _evolve_bitboard(self, history: Optional[NDArray] = None) -> NDArray[np.uint8]:
+        """
+        Evolve the grid in bit-packed form, unpacking each generation into the history if one
+        is given. Otherwise only the final grid is unpacked and returned.
+        """
+        initial_state = self._initial_state()
+        width = initial_state.shape[-1]
+        birth, survive = self.rule_instance.birth, self.rule_instance.survive
+
+        words = bitboard.pack_grid(initial_state)
+        next_words = np.empty_like(words)
+        if history is None:
+            # Without a history the generations can be advanced in temporal blocks.
+            bitboard.life_evolve(words, next_words, self.timesteps - 1, birth, survive, width)
+            return bitboard.unpack_grid(next_words, width)
+
+        for t in range(1, self.timesteps):
+            bitboard.life_step(words, next_words, birth, survive, width)
+            history[t] = bitboard.unpack_grid(next_words, width)
+            words, next_words = next_words, words
+        return history
+
 
 class Simulate1D:
     """Main simulation runner for 1D CA used in miner and validator routines"""
@@ -232,60 +545,81 @@ class Simulate1D:
         timesteps: int,
         rule_instance: ApplyRule,
         r: int = 1,
+        plot: bool = False,
     ):
         self.ca = ca
         self.timesteps = timesteps
         self.rule_instance = rule_instance
         self.r = r
+        self.plot = plot
 
     def run(self) -> NDArray[Any]:
+        # Elementary rules are stepped by a precompiled kernel instead of cellpylib's callback.
+        rule_number = getattr(self.rule_instance, "rule_number", None)
         try:
-            ca = cpl.evolve(
-                cellular_automaton=self.ca,
-                timesteps=self.timesteps,
-                apply_rule=self.rule_instance.rule_function,
-                r=self.r,
-            )
+            if rule_number is not None and self.r == 1:
+                ca = self._evolve(rule_number)
+            else:
+                ca = cpl.evolve(
+                    cellular_automaton=self.ca,
+                    timesteps=self.timesteps,
+                    apply_rule=self.rule_instance.rule_function,
+                    r=self.r,
+                )
         except Exception as e:
             raise RuntimeError(f"Error running simulation.") from e
 
-        cpl.plot(ca)
+        if self.plot:
+            cpl.plot(ca)
         return ca
 
+    def _evolve(self, rule_number: int) -> NDArray[np.uint8]:
+        """Evolve an elementary rule into a preallocated history that includes the initial state."""
+        initial_state = np.asarray(self.ca)
+        if initial_state.ndim == 2:
+            initial_state = initial_state[-1]
+
+        width = initial_state.shape[0]
+        history = np.empty((self.timesteps, width), dtype=np.uint8)
+        history[0] = initial_state
+
+        # Step 64 cells per word in bit-packed form, unpacking each generation into the history
+        # inside the same compiled loop.
+        bitboard.elementary_evolve(bitboard.pack_grid(history[:1])[0], history, rule_number)
+        return history
 
-# Test rules with Simulate class
-if __name__ == "__main__":  #
-    initial_state = init_random_2d(60, 60, 0.1)
+
+# Test rules with the Simulate and Simulate1D classes; run from the repository root with
+# `python -m automata.utils.rulesets`.
+if __name__ == "__main__":
+    initial_state = InitialConditions(60, 0.1).init_random_2d(60, 60)
     # Rules
     rule_instance = ConwayRule()
     # rule_instance = HighLifeRule()
     # rule_instance = DayAndNightRule()
-    # rule_instance = Rule30()
-    # rule_instance = Rule110()
-    # rule_instance = FredkinRule() 
+    # rule_instance = FredkinRule()
     # rule_instance = BriansBrainRule()
-    #rule_instance = SeedsRule() 
-    #
+    # rule_instance = SeedsRule()
     sim = Simulate(
         initial_state,
         timesteps=100,
         rule_instance=rule_instance,
         neighbourhood_type="Moore",
         r=1,
+        plot=True,
     )
     result = sim.run()
     print(result)
 
-
-# Test rules with Simulate1D class
-if __name__ == "__main__":
     initial_state = cpl.init_simple(100)
     rule_instance = Rule30()
+    # rule_instance = Rule110()
     sim = Simulate1D(
         initial_state,
         timesteps=100,
         rule_instance=rule_instance,
         r=1,
+        plot=True,
     )
     result = sim.run()
     print(result)
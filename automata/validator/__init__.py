@@ -1,3 +1,2 @@
-from . import forward
 from . import reward
 from . import validator
@@ -24,7 +24,7 @@ import bittensor as bt
 from typing import List
 from traceback import print_exception
 
-from automata.protocol import spec_version
+from automata import __spec_version__ as spec_version
 from automata.miner.config import check_config, add_args, config
 from automata.miner.neuron import BaseNeuron
 
@@ -33,51 +33,72 @@ function_mapping = {
     "cpl.init_random2d": cpl.init_random2d,
 }
 
-# Cellular automata rule functions.
-rule_class_mapping = {
-    "Conway": rulesets.ConwayRule,
-    "HighLife": rulesets.HighLifeRule,
-    "DayAndNight": rulesets.DayAndNightRule,
-}
-
 
 class miner(BaseMinerNeuron):
     def __init__(self, config=None):
         super(miner, self).__init__(config=config)
+        self._index_hotkeys()
+        self.warm_up()
+
+    def resync_metagraph(self):
+        super(miner, self).resync_metagraph()
+        self._index_hotkeys()
+
+    def _index_hotkeys(self):
+        """
+        Map each registered hotkey to its uid, so blacklist and priority look callers up in
+        constant time instead of scanning the metagraph's hotkey list on every request.
+        """
+        self._hotkey_to_uid = {
+            hotkey: uid for uid, hotkey in enumerate(self.metagraph.hotkeys)
+        }
+
+    def warm_up(self):
+        """
+        Run every known rule on a small dummy grid in both neighbourhoods, so the compiled
+        kernels are built (or loaded from the disk cache) before the first request arrives
+        rather than inside it.
+        """
+        dummy = np.zeros((4, 4), dtype=np.uint8)
+        for rule_instance in rulesets.RULES.values():
+            for neighbourhood_func in ("Moore", "von Neumann"):
+                self.evolve_automata(dummy, 2, rule_instance, 1, neighbourhood_func)
+        bt.logging.info("Warmed up the cellular automata kernels.")
 
     def evolve_automata(
         self,
         initial_state: np.ndarray,
         steps: int,
-        rule_instance: rulesets.Rule,
+        rule_instance: rulesets.ApplyRule,
         r: int,
         neighbourhood_func: str,
-        memoize: str or bool or None,
     ) -> np.ndarray:
         """
         Simulate a cellular automata with the given parameters.
 
+        Rules with compiled kernels (see rulesets.Simulate) are stepped without any per-cell
+        Python callbacks. The kernels are module-level and disk-cached, so they are compiled
+        at most once per process rather than per request.
+
         Args:
             initial_state (NDArray): The initial state of the cellular automata.
-            timesteps (int): The number of timesteps to simulate.
-            rule_instance (rulesets.Rule): The rule to apply to the cellular automata.
+            steps (int): The number of timesteps to simulate.
+            rule_instance (rulesets.ApplyRule): The rule to apply to the cellular automata.
             r (int): The radius of the neighbourhood.
-            neighbourhood_type (str): The type of neighbourhood to use.
-            memoize (str): The memoization type to use.
+            neighbourhood_func (str): The type of neighbourhood to use.
 
         Returns:
-            NDArray: The evolved state of the cellular automata.
+            NDArray: The final state of the cellular automata.
         """
         bt.logging.trace(f"Simulating cellular automata with {steps} timesteps.")
 
-        automaton = cpl.evolve2d(
-            cellular_automaton=initial_state,
+        automaton = rulesets.Simulate(
+            initial_state,
             timesteps=steps,
-            apply_rule=rule_instance.apply_rule,
+            rule_instance=rule_instance,
             r=r,
-            neighbourhood=neighbourhood_func,
-            memoize=memoize,
-        )
+            neighbourhood_type=neighbourhood_func,
+        ).run(keep_history=False)
         return automaton
 
     async def forward(
@@ -87,45 +108,39 @@ class miner(BaseMinerNeuron):
         (
             initial_state,
             steps,
-            neighbourhood_func,
             rule_func,
+            neighbourhood_func,
         ) = synapse.deserialize_parameters()
 
-        # Log the parameters.
+        # Log the parameters, summarising the grid rather than formatting the whole array.
         bt.logging.info(
-            f"Received cellular automata request from {synapse.dendrite.hotkey}."
+            f"Received cellular automata request from {synapse.dendrite.hotkey}: "
+            f"{initial_state.shape} grid with {np.count_nonzero(initial_state)} live cells, "
+            f"{steps} timesteps, {rule_func} rule, {neighbourhood_func} neighbourhood."
         )
-        bt.logging.info(f"Inital state: {initial_state}")
-        bt.logging.info(f"Timesteps: {steps}")
-        bt.logging.info(f"Neighbourhood type: {neighbourhood_func}")
-        bt.logging.info(f"Rule function: {rule_func}")
-
-        # Map rule_func str to callable rule class dict.
-        rule_class_name = rule_func
-        rule_class = rule_class_mapping.get(rule_class_name, None)
-        if rule_class is None:
-            raise ValueError(f"Rule {rule_class_name} is not recognized.")
-        rule_instance = rule_class()
+
+        # Map rule_func str to its rule instance.
+        rule_instance = rulesets.RULES.get(rule_func, None)
+        if rule_instance is None:
+            raise ValueError(f"Rule {rule_func} is not recognized.")
 
         # Generate the cellular automata.
         automaton = self.evolve_automata(
             initial_state=initial_state,
-            timesteps=steps,
-            rule_instance=rule_instance.apply_rule,
+            steps=steps,
+            rule_instance=rule_instance,
             r=1,
-            neighbourhood_type=neighbourhood_func,
-            memoize=None,
+            neighbourhood_func=neighbourhood_func,
         )
         if automaton is None:
             raise ValueError("Automaton could not be generated.")
         else:
             bt.logging.info(
-                f"Simulated cellular automata over {steps} timesteps with {rule_class_name}."
+                f"Simulated cellular automata over {steps} timesteps with {rule_func}."
             )
 
         # Return the response to the validator.
-        automaton = automaton.tobytes()
-        synapse.automaton_bytes = automaton
+        synapse.serialize_automaton(automaton)
         bt.logging.info(f"Transmitting serialized automaton to {synapse.dendrite.hotkey}.")
         return synapse
 
@@ -162,7 +177,7 @@ class miner(BaseMinerNeuron):
         Otherwise, allow the request to be processed further.
         """
         # TODO(developer): Define how miners should blacklist requests.
-        if synapse.dendrite.hotkey not in self.metagraph.hotkeys:
+        if synapse.dendrite.hotkey not in self._hotkey_to_uid:
             # Ignore requests from unrecognized entities.
             bt.logging.trace(
                 f"Blacklisting unrecognized hotkey {synapse.dendrite.hotkey}"
@@ -195,16 +210,16 @@ class miner(BaseMinerNeuron):
         - A higher stake results in a higher priority value.
         """
         # TODO(developer): Define how miners should prioritize requests.
-        caller_uid = self.metagraph.hotkeys.index(
+        caller_uid = self._hotkey_to_uid[
             synapse.dendrite.hotkey
-        )  # Get the caller index.
-        prirority = float(
+        ]  # Get the caller index.
+        priority = float(
             self.metagraph.S[caller_uid]
         )  # Return the stake as the priority.
         bt.logging.trace(
-            f"Prioritizing {synapse.dendrite.hotkey} with value: ", prirority
+            f"Prioritizing {synapse.dendrite.hotkey} with value: {priority}"
         )
-        return prirority
+        return priority
 
 
 # This is the main function, which runs the miner.
@@ -16,8 +16,9 @@
 
 import os
 import time
-import random
+import asyncio
 
+import torch
 import numpy as np
 import bittensor as bt
 import cellpylib as cpl
@@ -26,11 +27,14 @@ import automata
 from automata.utils import rulesets
 from automata.protocol import CAsynapse
 from automata.utils.uids import get_random_uids
-from automata.validator import forward
-from automata.validator.reward import get_rewards, reward
 from automata.validator.validator import BaseValidatorNeuron
 
 
+# Rule and neighbourhood names the validator draws its queries from.
+RULE_FUNCS = ("Conway", "HighLife", "DayAndNight")
+NEIGHBORHOOD_FUNCS = ("Moore", "von Neumann")
+
+
 class Validator(BaseValidatorNeuron):
     
     def __init__(self, config=None):
@@ -39,52 +43,86 @@ class Validator(BaseValidatorNeuron):
         bt.logging.info("load_state()")
         self.load_state()
 
+        self.rng = np.random.default_rng()
+
     def get_random_params(self):
         # Generate a random initial state as a 2D numpy array
-        initial_state = np.random.randint(2, size=(10, 10))
+        initial_state = self.rng.integers(2, size=(10, 10), dtype=np.uint8)
 
         # Choose a random number of steps
-        steps = random.randint(50, 100)
-
-        # Choose a random rule function. There should be a better way than adding new strings each time!
-        rule_funcs = [
-                "Conway",
-                "HighLife",
-                "DayAndNight",
-            ]
-        rule_func = random.choice(rule_funcs)
-
-        # Choose a random neighborhood function. There should be a better way than adding new strings each time!
-        neighborhood_funcs = ["Moore", "Von Neumann"]
-        neighborhood_func = random.choice(neighborhood_funcs)
+        steps = int(self.rng.integers(50, 100, endpoint=True))
+
+        # Choose a random rule function.
+        rule_func = RULE_FUNCS[self.rng.integers(len(RULE_FUNCS))]
+
+        # Choose a random neighborhood function.
+        neighborhood_func = NEIGHBORHOOD_FUNCS[self.rng.integers(len(NEIGHBORHOOD_FUNCS))]
             
         # Log and return the parameters.
         if initial_state is not None and steps is not None and rule_func is not None and neighborhood_func is not None:
             bt.logging.info(
-                f"Generated cellular automata parameters: {initial_state}, {steps}, {rule_func}, {neighborhood_func}"
+                f"Generated cellular automata parameters: {initial_state.shape} grid, {steps}, {rule_func}, {neighborhood_func}"
             )
         return initial_state, steps, rule_func, neighborhood_func
     
     
-    def query_automata_miners(self, initial_state, steps, rule_func, neighborhood_func):
+    async def _query_miner(self, uid, synapse):
+        """Query a single miner, returning its response (None on failure)."""
+        try:
+            return await self.dendrite.forward(
+                axons=self.metagraph.axons[uid],
+                synapse=synapse.copy(),
+                deserialize=True,
+            )
+        except Exception as e:
+            # A failed query only costs that miner its response.
+            bt.logging.warning(f"Query to miner {uid} failed: {e}")
+            return None
+
+    async def query_automata_miners(self, initial_state, steps, rule_func, neighborhood_func):
+        """
+        Query a random sample of miners concurrently with the given simulation parameters.
+
+        Returns:
+            Tuple[list, torch.LongTensor]: The responses, in the order of the queried miner uids.
+        """
         miner_uids = get_random_uids(self, k=self.config.neuron.sample_size)
-        responses = self.dendrite.query(
-            axons=[self.metagraph.axons[uid] for uid in miner_uids],
-            synapse=CAsynapse(
-                initial_state,
-                steps, 
-                rule_func, 
-                neighborhood_func),
-            deserialize=True,
+        synapse = CAsynapse()
+        synapse.serialize_parameters(initial_state, steps, rule_func, neighborhood_func)
+
+        # Query every miner concurrently so the round trips overlap instead of adding up.
+        responses = await asyncio.gather(
+            *(self._query_miner(uid, synapse) for uid in miner_uids)
         )
-        return responses, miner_uids
+        return list(responses), miner_uids
     
     
-    def compute_scores(self, responses):
-        outputs = [response.payload for response in responses]
-        bt.logging.info(f"Received responses: {outputs}")
-        scores = [np.sum(output) for output in outputs]
-        scores = np.array(scores) / np.sum(scores)
+    def compute_scores(self, responses, expected_shape):
+        """
+        Score each miner by the live cells in the grid it returned, normalised to sum to one.
+
+        Args:
+            responses (list): The deserialized grids from query_automata_miners, with None for
+                miners that did not answer.
+            expected_shape (tuple): The shape of the initial state the miners were sent.
+
+        Returns:
+            NDArray[np.float64]: One score per response. Missing responses, and grids whose shape
+                differs from expected_shape, score zero.
+        """
+        bt.logging.info(f"Received {len(responses)} responses.")
+        expected_shape = tuple(expected_shape)
+
+        # Copy every grid into one contiguous buffer so the sums come out of a single reduction.
+        cells = np.zeros((len(responses), int(np.prod(expected_shape))), dtype=np.uint8)
+        for index, response in enumerate(responses):
+            if response is not None and np.shape(response) == expected_shape:
+                cells[index] = np.ravel(response)
+        scores = cells.sum(axis=1, dtype=np.float64)
+        total = scores.sum()
+        if total:
+            # Normalise in place with one multiply by the reciprocal.
+            scores *= 1.0 / total
         return scores
 
     async def forward(self):
@@ -94,35 +132,27 @@ class Validator(BaseValidatorNeuron):
         - Getting the responses
         - Rewarding the miners
         - Updating the scores
+
+        Syncing the metagraph and saving the state are left to the run loop, which does both
+        after every round of forwards.
         """
-                # Sync with the metagraph and get the miner uids.
-        self.sync()
-           
         # Get the params for the CA simulation.
         initial_state, steps, rule_func, neighborhood_func = self.get_random_params()
-        bt.logging.info(f"Params: {initial_state}, {steps}, {rule_func}, {neighborhood_func}")
-        
+        bt.logging.info(f"Params: {initial_state.shape} grid, {steps}, {rule_func}, {neighborhood_func}")
+
         # Query the network for the CA simulation results.
-        responses = self.query_network(initial_state, steps, rule_func, neighborhood_func)
-        miner_uids = []
-        bt.logging.info(f"Responses: {responses}")
-        
+        responses, miner_uids = await self.query_automata_miners(
+            initial_state, steps, rule_func, neighborhood_func
+        )
+        bt.logging.info(f"Responses: {sum(r is not None for r in responses)} of {len(responses)}")
+
         # Get the rewards for the responses.
-        rewards = get_rewards(self, query=self.step, responses=responses)
+        scores = self.compute_scores(responses, initial_state.shape)
+        rewards = torch.FloatTensor(scores).to(self.device)
         bt.logging.info(f"Scored responses: {rewards}")
-        
+
         # Update the scores based on the rewards.
-        self.compute_scores(rewards)
         self.update_scores(rewards, miner_uids)
-        
-        # Save the state.
-        self.save_state()
-        
-
-        
-        
-        
-        return await forward(self)
 
 
 # The main function parses the configuration and runs the validator.
@@ -0,0 +1,73 @@
+# The MIT License (MIT)
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+"""
+Time the bit-packed Life kernel against the byte-per-cell one.
+
+Run from the repository root with `python scripts/benchmark_life.py`; each line
+reports the mean wall time of advancing a random Conway grid, including the
+packing and unpacking the bitboard path pays for.
+"""
+
+import time
+
+import numpy as np
+
+from automata.utils import bitboard, kernels
+
+CASES = ((10, 100), (100, 100), (1024, 100), (4096, 32))
+BIRTH, SURVIVE = 1 << 3, (1 << 2) | (1 << 3)
+
+
+def evolve_bytes(grid: np.ndarray, steps: int) -> np.ndarray:
+    kernel = kernels.life_kernel(BIRTH, SURVIVE)
+    current, following = grid.copy(), np.empty_like(grid)
+    for _ in range(steps):
+        kernel(current, following)
+        current, following = following, current
+    return current
+
+
+def evolve_bits(grid: np.ndarray, steps: int) -> np.ndarray:
+    words = bitboard.pack_grid(grid)
+    out = np.empty_like(words)
+    bitboard.life_evolve(words, out, steps, BIRTH, SURVIVE, grid.shape[1])
+    return bitboard.unpack_grid(out, grid.shape[1])
+
+
+def mean_ms(evolve, grid: np.ndarray, steps: int) -> float:
+    evolve(grid, steps)
+    repeats = max(1, int(1e7 // (grid.size * steps)))
+    start = time.perf_counter()
+    for _ in range(repeats):
+        evolve(grid, steps)
+    return (time.perf_counter() - start) / repeats * 1e3
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    for size, steps in CASES:
+        grid = (rng.random((size, size)) < 0.3).astype(np.uint8)
+        assert np.array_equal(
+            evolve_bytes(grid, steps), evolve_bits(grid, steps)
+        )
+        byte_ms = mean_ms(evolve_bytes, grid, steps)
+        bit_ms = mean_ms(evolve_bits, grid, steps)
+        print(
+            f"{size}x{size}, {steps} generations: bytes {byte_ms:.2f} ms, "
+            f"bitboard {bit_ms:.2f} ms ({byte_ms / bit_ms:.1f}x)"
+        )
@@ -0,0 +1,147 @@
+# The MIT License (MIT)
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+import json
+import hashlib
+import unittest
+
+import numpy as np
+
+from automata.protocol import CAsynapse
+
+
+def _round_trip_automaton(array):
+    sender = CAsynapse()
+    sender.serialize_automaton(array)
+    receiver = CAsynapse(
+        automaton_bytes=sender.automaton_bytes,
+        automaton_metadata_bytes=sender.automaton_metadata_bytes,
+    )
+    return receiver.deserialize_automaton(verify=True)
+
+
+def _round_trip_parameters(array):
+    sender = CAsynapse()
+    sender.serialize_parameters(array, 5, "Conway", "Moore")
+    receiver = CAsynapse(
+        metadata_bytes=sender.metadata_bytes, array_bytes=sender.array_bytes
+    )
+    return receiver.deserialize_parameters(verify=True)
+
+
+class ProtocolTestCase(unittest.TestCase):
+    """
+    Round trips of CAsynapse payloads through serialization and back.
+    """
+
+    def test_round_trip_parameters(self):
+        initial_state = np.random.default_rng(0).integers(2, size=(10, 13))
+        state, steps, rule_func, neighborhood_func = _round_trip_parameters(
+            initial_state
+        )
+        self.assertEqual(
+            (steps, rule_func, neighborhood_func), (5, "Conway", "Moore")
+        )
+        self.assertEqual(state.dtype, np.uint8)
+        np.testing.assert_array_equal(state, initial_state)
+
+    def test_two_state_grids_are_bit_packed(self):
+        automaton = np.random.default_rng(1).integers(
+            2, size=(3, 7, 13), dtype=np.uint8
+        )
+        synapse = CAsynapse()
+        synapse.serialize_automaton(automaton)
+        # Each 13-cell row takes two bytes.
+        self.assertEqual(len(synapse.automaton_bytes), 3 * 7 * 2)
+        np.testing.assert_array_equal(
+            _round_trip_automaton(automaton), automaton
+        )
+
+    def test_three_state_grids_are_sent_raw(self):
+        automaton = np.random.default_rng(2).integers(
+            3, size=(4, 9), dtype=np.uint8
+        )
+        synapse = CAsynapse()
+        synapse.serialize_automaton(automaton)
+        self.assertEqual(len(synapse.automaton_bytes), automaton.size)
+        np.testing.assert_array_equal(
+            _round_trip_automaton(automaton), automaton
+        )
+
+    def test_corrupted_payload_fails_verification(self):
+        sender = CAsynapse()
+        sender.serialize_automaton(np.ones((8, 8), dtype=np.uint8))
+        corrupted = (
+            bytes([sender.automaton_bytes[0] ^ 1]) + sender.automaton_bytes[1:]
+        )
+        receiver = CAsynapse(
+            automaton_bytes=corrupted,
+            automaton_metadata_bytes=sender.automaton_metadata_bytes,
+        )
+        with self.assertRaises(ValueError):
+            receiver.deserialize_automaton(verify=True)
+
+    def test_legacy_json_sha256_payload(self):
+        # Peers on the previous release send JSON metadata, a sha256 hex
+        # digest and raw int64 cells.
+        initial_state = np.random.default_rng(3).integers(2, size=(6, 6))
+        array_bytes = initial_state.tobytes()
+        metadata = {
+            "dtype": str(initial_state.dtype),
+            "shape": initial_state.shape,
+            "hash": hashlib.sha256(array_bytes).hexdigest(),
+            "steps": 7,
+            "rule_func": "HighLife",
+            "neighborhood_func": "Moore",
+        }
+        synapse = CAsynapse(
+            metadata_bytes=json.dumps(metadata).encode("utf-8"),
+            array_bytes=array_bytes,
+        )
+        state, steps, rule_func, neighborhood_func = (
+            synapse.deserialize_parameters(verify=True)
+        )
+        self.assertEqual(
+            (steps, rule_func, neighborhood_func), (7, "HighLife", "Moore")
+        )
+        np.testing.assert_array_equal(state, initial_state)
+
+        synapse = CAsynapse(
+            automaton_bytes=array_bytes,
+            automaton_metadata_bytes=json.dumps(metadata).encode("utf-8"),
+        )
+        np.testing.assert_array_equal(synapse.deserialize(), initial_state)
+
+    def test_round_trip_degenerate_arrays(self):
+        for array in (
+            np.zeros((0, 5), dtype=np.uint8),
+            np.zeros((3, 0), dtype=np.uint8),
+            np.array(1, dtype=np.uint8),
+            np.array(2, dtype=np.uint8),
+        ):
+            with self.subTest(shape=array.shape, value=array.sum()):
+                automaton = _round_trip_automaton(array)
+                self.assertEqual(automaton.shape, array.shape)
+                np.testing.assert_array_equal(automaton, array)
+
+                initial_state = _round_trip_parameters(array)[0]
+                self.assertEqual(initial_state.shape, array.shape)
+                np.testing.assert_array_equal(initial_state, array)
+
+
+if __name__ == "__main__":
+    unittest.main()
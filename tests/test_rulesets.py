@@ -0,0 +1,176 @@
+# The MIT License (MIT)
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+import unittest
+
+import cellpylib as cpl
+import numpy as np
+
+from automata.utils import bitboard, gpu, rulesets
+
+# Odd widths either side of a 64-cell word, and a grid taller than one band.
+SHAPES = [(1, 1), (5, 3), (17, 13), (9, 65), (bitboard.BAND_ROWS + 3, 70)]
+# More generations than one temporal block of the bitboard sweep.
+TIMESTEPS = bitboard.TIME_BLOCK + 4
+
+
+def count_neighbours(grid, neighbourhood, r=1):
+    offsets = [
+        (di, dj)
+        for di in range(-r, r + 1)
+        for dj in range(-r, r + 1)
+        if (di, dj) != (0, 0)
+        and (neighbourhood == "Moore" or abs(di) + abs(dj) <= r)
+    ]
+    return sum(
+        np.roll(grid, offset, axis=(0, 1)).astype(np.int64)
+        for offset in offsets
+    )
+
+
+def reference_step(rule, grid, neighbourhood, r=1):
+    """One generation with periodic boundaries, built from np.roll alone."""
+    if isinstance(rule, rulesets.BriansBrainRule):
+        n = count_neighbours(grid == 1, neighbourhood, r)
+        return np.where(
+            grid == 1, 2, np.where((grid == 0) & (n == 2), 1, 0)
+        ).astype(np.uint8)
+    n = count_neighbours(grid, neighbourhood, r)
+    born = (rule.birth >> n) & 1
+    survives = (rule.survive >> n) & 1
+    return np.where(grid == 1, survives, born).astype(np.uint8)
+
+
+def reference_history(rule, grid, timesteps, neighbourhood, r=1):
+    history = [grid.astype(np.uint8)]
+    for _ in range(timesteps - 1):
+        history.append(reference_step(rule, history[-1], neighbourhood, r))
+    return np.stack(history)
+
+
+class SimulateTestCase(unittest.TestCase):
+    """
+    Simulate against a np.roll reference for every rule and execution path.
+    """
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def random_grid(self, rule, shape):
+        states = 3 if isinstance(rule, rulesets.BriansBrainRule) else 2
+        return self.rng.integers(states, size=shape, dtype=np.uint8)
+
+    def test_matches_reference(self):
+        for name, rule in rulesets.RULES.items():
+            for neighbourhood in ("Moore", "von Neumann"):
+                for shape in SHAPES:
+                    with self.subTest(
+                        rule=name, neighbourhood=neighbourhood, shape=shape
+                    ):
+                        grid = self.random_grid(rule, shape)
+                        expected = reference_history(
+                            rule, grid, TIMESTEPS, neighbourhood
+                        )
+                        simulation = rulesets.Simulate(
+                            grid,
+                            TIMESTEPS,
+                            rule,
+                            neighbourhood_type=neighbourhood,
+                        )
+                        np.testing.assert_array_equal(
+                            simulation.run(), expected
+                        )
+                        np.testing.assert_array_equal(
+                            simulation.run(keep_history=False), expected[-1]
+                        )
+
+    def test_radius_two_matches_reference(self):
+        # r=2 has no whole-grid step, so this exercises the rule callbacks.
+        for name, rule in rulesets.RULES.items():
+            for neighbourhood in ("Moore", "von Neumann"):
+                with self.subTest(rule=name, neighbourhood=neighbourhood):
+                    grid = self.random_grid(rule, (9, 11))
+                    expected = reference_history(
+                        rule, grid, 4, neighbourhood, r=2
+                    )
+                    # cellpylib takes a (1, H, W) stack, as InitialConditions
+                    # builds it.
+                    simulation = rulesets.Simulate(
+                        grid[None],
+                        4,
+                        rule,
+                        r=2,
+                        neighbourhood_type=neighbourhood,
+                    )
+                    np.testing.assert_array_equal(simulation.run(), expected)
+
+    def test_neighbourhood_name_is_case_insensitive(self):
+        grid = self.random_grid(rulesets.RULES["Conway"], (12, 12))
+        expected = reference_history(
+            rulesets.RULES["Conway"], grid, 5, "von Neumann"
+        )
+        simulation = rulesets.Simulate(
+            grid, 5, rulesets.RULES["Conway"], neighbourhood_type="Von Neumann"
+        )
+        np.testing.assert_array_equal(simulation.run(), expected)
+
+    def test_run_batch_matches_reference(self):
+        rule = rulesets.RULES["HighLife"]
+        grids = self.rng.integers(2, size=(3, 11, 9), dtype=np.uint8)
+        final = rulesets.Simulate(grids[0], TIMESTEPS, rule).run_batch(grids)
+        for grid, got in zip(grids, final):
+            np.testing.assert_array_equal(
+                got, reference_history(rule, grid, TIMESTEPS, "Moore")[-1]
+            )
+
+    def test_gpu_evolve_matches_reference(self):
+        # Runs on the device when there is one, on the CPU fallback otherwise.
+        rule = rulesets.RULES["DayAndNight"]
+        grid = self.random_grid(rule, (37, 45))
+        expected = reference_history(rule, grid, TIMESTEPS, "Moore")
+        history = np.empty_like(expected)
+        history[0] = grid
+        final = gpu.life_evolve(
+            grid, TIMESTEPS, rule.birth, rule.survive, history
+        )
+        np.testing.assert_array_equal(history, expected)
+        np.testing.assert_array_equal(final, expected[-1])
+
+
+class Simulate1DTestCase(unittest.TestCase):
+    """
+    Simulate1D against cellpylib's own evolution of the elementary rules.
+    """
+
+    def test_matches_cellpylib(self):
+        rng = np.random.default_rng(1)
+        for rule in (rulesets.Rule30(), rulesets.Rule110()):
+            for width in (1, 7, 64, 65, 130):
+                with self.subTest(rule=rule.rule_number, width=width):
+                    initial_state = rng.integers(2, size=(1, width))
+                    expected = cpl.evolve(
+                        initial_state,
+                        timesteps=20,
+                        apply_rule=rule.rule_function,
+                        r=1,
+                    )
+                    got = rulesets.Simulate1D(initial_state, 20, rule).run()
+                    np.testing.assert_array_equal(got, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+# The MIT License (MIT)
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+import unittest
+
+import numpy as np
+
+from neurons.validator import Validator
+
+
+class ComputeScoresTestCase(unittest.TestCase):
+    """
+    Scoring of miner responses against the grid the validator sent.
+    """
+
+    def compute_scores(self, responses, expected_shape):
+        # compute_scores only reads its arguments; no validator is needed.
+        return Validator.compute_scores(None, responses, expected_shape)
+
+    def test_scores_are_normalised_live_cell_counts(self):
+        responses = [np.ones((4, 4)), None, np.eye(4, dtype=np.uint8)]
+        scores = self.compute_scores(responses, (4, 4))
+        np.testing.assert_allclose(scores, [0.8, 0.0, 0.2])
+
+    def test_wrong_shape_scores_zero_against_the_sent_shape(self):
+        # A cheater answering first with a tiny grid must not set the shape.
+        honest = np.zeros((10, 10), dtype=np.uint8)
+        honest[:5] = 1
+        responses = [np.ones((1, 1), dtype=np.uint8), honest, honest, honest]
+        scores = self.compute_scores(responses, (10, 10))
+        np.testing.assert_allclose(scores, [0.0, 1 / 3, 1 / 3, 1 / 3])
+
+    def test_no_live_cells_scores_zero(self):
+        responses = [None, np.zeros((3, 3)), np.ones((2, 2))]
+        np.testing.assert_array_equal(
+            self.compute_scores(responses, (3, 3)), 0.0
+        )
+        self.assertEqual(len(self.compute_scores([], (3, 3))), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()